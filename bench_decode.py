@@ -0,0 +1,92 @@
+"""Benchmark decode respon /users/me dan /users/gm
+
+Membandingkan cara lama (json.loads penuh + probe field points) dengan
+USER_SCHEMA.decode / GM_SCHEMA.decode. Jalankan: python bench_decode.py
+"""
+import json
+import timeit
+import tracemalloc
+
+from p import USER_SCHEMA, GM_SCHEMA, USER_POINT_FIELDS, to_int, msgspec, orjson
+
+USER_PAYLOAD = json.dumps({
+    "id": 123,
+    "username": "alice",
+    "referralCode": "ABC123",
+    "isBot": False,
+    "socials": {
+        "discord": {"username": "alice#1", "id": "x" * 20, "avatar": "y" * 40},
+        "twitter": {"username": "alice_tw", "id": "z" * 20},
+        "telegram": None
+    },
+    "totalPoints": "12,345",
+    "streakCount": 7,
+    "lastGmAt": "2026-10-18T03:00:00.000Z",
+    "nextLogin": "2026-10-19T03:00:00.000Z",
+    "quests": [
+        {"id": i, "name": f"quest {i}", "meta": {"tags": [1, 2, 3], "description": "d" * 40}}
+        for i in range(50)
+    ],
+    "wallets": ["0x" + "ab" * 20] * 10,
+    "bio": "b" * 500
+}).encode()
+
+GM_PAYLOAD = json.dumps({
+    "finalPoints": 12400,
+    "streakCount": 8,
+    "dailyBooster": 5,
+    "history": [{"day": i, "points": i * 10} for i in range(100)]
+}).encode()
+
+def baseline_user(content: bytes) -> dict:
+    """Cara lama get_user_info: decode penuh lalu probe field"""
+    user_data = json.loads(content)
+    socials = user_data.get('socials', {})
+    discord = socials.get('discord', {}).get('username')
+    points = 0
+    for field in USER_POINT_FIELDS:
+        if field in user_data and user_data[field] is not None:
+            points = to_int(user_data[field])
+            if points > 0:
+                break
+    streak = to_int(user_data.get('streakCount', 0))
+    return user_data
+
+def baseline_gm(content: bytes) -> dict:
+    """Cara lama claim_daily_gm: decode penuh lalu ambil finalPoints"""
+    result = json.loads(content)
+    new_points = to_int(result.get('finalPoints', 0))
+    streak = to_int(result.get('streakCount', 0))
+    booster = to_int(result.get('dailyBooster', 0))
+    return result
+
+def measure(fn, content: bytes, number: int = 2000):
+    """Return (mikrodetik per call, byte tertahan, byte peak)"""
+    seconds = min(timeit.repeat(lambda: fn(content), number=number, repeat=5))
+
+    tracemalloc.start()
+    result = fn(content)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return seconds / number * 1e6, retained, peak
+
+def main():
+    decoder = 'msgspec' if msgspec is not None else ('orjson' if orjson is not None else 'json')
+    print(f"Decoder: {decoder}")
+    print(f"{'Case':<22} {'us/call':>10} {'retained B':>12} {'peak B':>10}")
+    print(f"{'-'*57}")
+
+    cases = [
+        ('users/me baseline', baseline_user, USER_PAYLOAD),
+        ('users/me schema', USER_SCHEMA.decode, USER_PAYLOAD),
+        ('users/gm baseline', baseline_gm, GM_PAYLOAD),
+        ('users/gm schema', GM_SCHEMA.decode, GM_PAYLOAD)
+    ]
+    for name, fn, content in cases:
+        us, retained, peak = measure(fn, content)
+        print(f"{name:<22} {us:>10.2f} {retained:>12,} {peak:>10,}")
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,291 @@
 import requests
 import json
+import os
 import time
 import random
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import threading
-from typing import List, Dict, Optional
+import warnings
+from functools import partial
+from typing import Any, List, Dict, Optional, Union
 from web3 import Web3
 from eth_account import Account
 from eth_account.messages import encode_defunct
 import pytz
+import numpy as np
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Field points dari API, urut berdasarkan prioritas
+USER_POINT_FIELDS = (
+    'totalPoints',
+    'points',
+    'total_points',
+    'point',
+    'finalPoints',
+    'accumulatedPoints',
+    'userPoints'
+)
+GM_POINT_FIELDS = ('finalPoints',) + tuple(f for f in USER_POINT_FIELDS if f != 'finalPoints')
+
+SOCIAL_FIELDS = ('discord', 'twitter', 'telegram')
+
+def to_int(value, default=0) -> int:
+    """Konversi value API ke int (int, float, atau string dengan koma)"""
+    if type(value) is int:
+        return value
+    try:
+        if value is None:
+            return default
+        if isinstance(value, (int, float)):
+            return int(value)
+        if isinstance(value, str):
+            return int(value.replace(',', ''))
+        return default
+    except:
+        return default
+
+def loads_json(content: bytes):
+    """Decode JSON memakai decoder tercepat yang tersedia"""
+    if msgspec is not None:
+        return msgspec.json.decode(content)
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+if msgspec is not None:
+    # Field scalar bertipe Any: projection sudah toleran ke tipe apa pun, jadi
+    # variasi tipe dari API (mis. isBot: "no") tetap di fast path. Hanya
+    # struktur socials yang diketik agar field lain di dalamnya tidak di-decode.
+    class SocialSchema(msgspec.Struct):
+        username: Any = None
+
+    SocialValue = Union[SocialSchema, list, str, None]
+
+    class SocialsSchema(msgspec.Struct):
+        discord: SocialValue = None
+        twitter: SocialValue = None
+        telegram: SocialValue = None
+
+    class PointsSchema(msgspec.Struct):
+        totalPoints: Any = None
+        points: Any = None
+        total_points: Any = None
+        point: Any = None
+        finalPoints: Any = None
+        accumulatedPoints: Any = None
+        userPoints: Any = None
+        streakCount: Any = None
+
+    class UserSchema(PointsSchema):
+        id: Any = None
+        username: Any = None
+        referralCode: Any = None
+        isBot: Any = None
+        socials: Union[SocialsSchema, list, str, None] = None
+        lastGmAt: Any = None
+        nextLogin: Any = None
+
+    class GmSchema(PointsSchema):
+        dailyBooster: Any = None
+else:
+    UserSchema = None
+    GmSchema = None
+
+class ResponseSchema:
+    """Decode respon API hanya untuk field yang dipakai bot"""
+
+    def __init__(self, fields: tuple, point_fields: tuple, social_fields: tuple = (), struct=None):
+        self.fields = fields
+        self.point_fields = point_fields
+        self.social_fields = social_fields
+        self.decoder = msgspec.json.Decoder(struct) if struct is not None else None
+
+    def decode(self, content: bytes) -> Optional[Dict]:
+        """Decode bytes respon menjadi dict hasil proyeksi, None jika bukan JSON object"""
+        if self.decoder is not None:
+            try:
+                return self.project(self.decoder.decode(content))
+            except msgspec.ValidationError:
+                # Sengaja decode ulang secara generik: hanya terjadi jika root
+                # bukan object atau socials berbentuk tak terduga (mis. angka)
+                pass
+
+        data = loads_json(content)
+        if not isinstance(data, dict):
+            return None
+        return self.project(data)
+
+    def project(self, data) -> Dict:
+        """Ambil field yang dipakai + resolve points dan socials"""
+        get = data.get if isinstance(data, dict) else partial(getattr, data)
+
+        result = {field: get(field) for field in self.fields}
+        result['points'] = 0
+        for field in self.point_fields:
+            value = get(field)
+            if value is not None:
+                points = to_int(value)
+                if points > 0:
+                    result['points'] = points
+                    break
+
+        if self.social_fields:
+            socials = get('socials')
+            for name in self.social_fields:
+                if isinstance(socials, dict):
+                    social = socials.get(name)
+                else:
+                    social = getattr(socials, name, None)
+                if isinstance(social, dict):
+                    result[name] = social.get('username')
+                else:
+                    result[name] = getattr(social, 'username', None)
+
+        return result
+
+USER_SCHEMA = ResponseSchema(
+    fields=('id', 'username', 'referralCode', 'isBot', 'streakCount', 'lastGmAt', 'nextLogin'),
+    point_fields=USER_POINT_FIELDS,
+    social_fields=SOCIAL_FIELDS,
+    struct=UserSchema
+)
+GM_SCHEMA = ResponseSchema(
+    fields=('streakCount', 'dailyBooster'),
+    point_fields=GM_POINT_FIELDS,
+    struct=GmSchema
+)
+
+# WIB = UTC+7 (Asia/Jakarta tanpa DST)
+WIB_OFFSET = np.timedelta64(7, 'h')
+ONE_DAY = np.timedelta64(1, 'D')
+
+# Field akun yang disimpan antar proses untuk claim plan
+STATE_FIELDS = (
+    'last_claim',
+    'next_login',
+    'points',
+    'streak',
+    'username',
+    'discord',
+    'twitter',
+    'telegram',
+    'referral_code',
+    'refreshed_at'
+)
+
+# Umur maksimum state tersimpan sebelum wallet di-refresh lagi via /users/me
+STATE_MAX_AGE = np.timedelta64(3, 'D')
+
+# Perkiraan jumlah request per aksi: onboard + (info) + gm
+PLAN_REQUESTS = {'claim': 2, 'skip': 0, 'refresh': 3}
+
+def split_utc_offset(value: str):
+    """Pisahkan suffix offset (Z / ±HH:MM) dari ISO timestamp, return (naive, offset menit)"""
+    if value.endswith('Z'):
+        return value[:-1], 0
+    suffix = value[-6:]
+    if len(value) > 6 and suffix[0] in '+-' and suffix[3] == ':' and suffix[1:3].isdigit() and suffix[4:].isdigit():
+        minutes = int(suffix[1:3]) * 60 + int(suffix[4:])
+        return value[:-6], -minutes if suffix[0] == '-' else minutes
+    return value, 0
+
+def parse_utc_timestamps(values: List) -> np.ndarray:
+    """Parse list ISO timestamp ke datetime64[ms] UTC, NaT jika kosong/tidak valid"""
+    cleaned = []
+    offsets = np.zeros(len(values), dtype='timedelta64[m]')
+    for i, value in enumerate(values):
+        if not isinstance(value, str) or not value:
+            cleaned.append('NaT')
+            continue
+        naive, offset = split_utc_offset(value)
+        cleaned.append(naive)
+        offsets[i] = offset
+
+    # Format offset lain (mis. +0700) tetap dikonversi numpy ke UTC, tanpa warning ke console
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        try:
+            return np.array(cleaned, dtype='datetime64[ms]') - offsets
+        except ValueError:
+            pass
+
+        parsed = np.full(len(cleaned), np.datetime64('NaT'), dtype='datetime64[ms]')
+        for i, value in enumerate(cleaned):
+            try:
+                parsed[i] = np.datetime64(value, 'ms')
+            except ValueError:
+                pass
+    return parsed - offsets
+
+def utc_now() -> np.datetime64:
+    """Waktu sekarang dalam UTC sebagai datetime64[ms]"""
+    return np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), 'ms')
+
+def wib_day_start(now: np.datetime64 = None) -> np.datetime64:
+    """Awal hari WIB saat ini, dinyatakan dalam UTC"""
+    if now is None:
+        now = utc_now()
+    return (now + WIB_OFFSET).astype('datetime64[D]') - WIB_OFFSET
+
+def plan_claims(last_gm_values: List, next_login_values: List, refreshed_at_values: List = None,
+                now: np.datetime64 = None) -> Dict:
+    """Hitung rencana claim seluruh akun dalam satu pass datetime64
+
+    - skip    : lastGmAt sudah di hari WIB ini, atau nextLogin belum lewat
+    - claim   : lastGmAt diketahui, sebelum hari WIB ini, dan state masih baru
+    - refresh : lastGmAt belum diketahui atau state lebih tua dari STATE_MAX_AGE
+    """
+    if now is None:
+        now = utc_now()
+
+    last_gm = parse_utc_timestamps(last_gm_values)
+    next_login = parse_utc_timestamps(next_login_values)
+
+    day_start = wib_day_start(now)
+
+    # Perbandingan dengan NaT selalu False
+    skip = (last_gm >= day_start) | (next_login > now)
+    if refreshed_at_values is None:
+        stale = np.zeros(len(last_gm), dtype=bool)
+    else:
+        refreshed_at = parse_utc_timestamps(refreshed_at_values)
+        stale = np.isnat(refreshed_at) | (refreshed_at < now - STATE_MAX_AGE)
+    refresh = (np.isnat(last_gm) | stale) & ~skip
+    claim = ~refresh & ~skip
+
+    actions = np.where(skip, 'skip', np.where(claim, 'claim', 'refresh'))
+    last_gm_wib = np.datetime_as_string(last_gm + WIB_OFFSET, unit='m')
+
+    counts = {
+        'claim': int(claim.sum()),
+        'skip': int(skip.sum()),
+        'refresh': int(refresh.sum())
+    }
+    expected_requests = sum(PLAN_REQUESTS[action] * count for action, count in counts.items())
+
+    return {
+        'now': now,
+        'day_start': day_start,
+        'actions': actions.tolist(),
+        'last_claim_wib': last_gm_wib.tolist(),
+        'counts': counts,
+        'expected_requests': expected_requests
+    }
+
+def format_wib_date(value: str) -> Optional[str]:
+    """Format string datetime64 WIB (YYYY-MM-DDTHH:MM) ke DD/MM/YYYY HH:MM WIB"""
+    if not value or value == 'NaT':
+        return None
+    return f"{value[8:10]}/{value[5:7]}/{value[0:4]} {value[11:16]} WIB"
 
 class SomniaMultiAccountBot:
     def __init__(self):
@@ -80,8 +357,7 @@ class SomniaMultiAccountBot:
             'username': None,
             'discord': None,
             'twitter': None,
-            'telegram': None,
-            'raw_user_data': {}
+            'telegram': None
         }
         self.accounts.append(account)
         return True
@@ -107,6 +383,51 @@ class SomniaMultiAccountBot:
             print(f"❌ Error loading private keys: {e}")
             return 0
 
+    def load_claim_state(self, filename: str = "claim_state.json"):
+        """Load lastGmAt/nextLogin dan info akun dari run sebelumnya"""
+        try:
+            with open(filename, 'r') as f:
+                state = json.load(f)
+
+            count = 0
+            for account in self.accounts:
+                saved = state.get(account['wallet_address'])
+                if isinstance(saved, dict):
+                    for field in STATE_FIELDS:
+                        if saved.get(field) is not None:
+                            account[field] = saved[field]
+                    count += 1
+
+            return count
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            print(f"❌ Error loading claim state: {e}")
+            return 0
+
+    def save_claim_state(self, filename: str = "claim_state.json"):
+        """Simpan lastGmAt/nextLogin dan info akun per wallet untuk run berikutnya"""
+        try:
+            try:
+                with open(filename, 'r') as f:
+                    state = json.load(f)
+                if not isinstance(state, dict):
+                    state = {}
+            except (FileNotFoundError, ValueError):
+                state = {}
+
+            for account in self.accounts:
+                state[account['wallet_address']] = {field: account.get(field) for field in STATE_FIELDS}
+
+            tmp_filename = filename + ".tmp"
+            with open(tmp_filename, 'w') as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_filename, filename)
+            return True
+        except Exception as e:
+            print(f"❌ Error saving claim state: {e}")
+            return False
+
     def load_proxies_from_txt(self, filename: str = "proxy.txt"):
         """Load proxy dari file txt"""
         try:
@@ -193,36 +514,7 @@ class SomniaMultiAccountBot:
 
     def safe_int(self, value, default=0):
         """Safely convert value to int"""
-        try:
-            if value is None:
-                return default
-            if isinstance(value, (int, float)):
-                return int(value)
-            if isinstance(value, str):
-                return int(value.replace(',', ''))
-            return default
-        except:
-            return default
-
-    def extract_points_from_data(self, user_data: dict) -> int:
-        """Extract points dari berbagai kemungkinan field di API"""
-        possible_fields = [
-            'totalPoints',
-            'points',
-            'total_points',
-            'point',
-            'finalPoints',
-            'accumulatedPoints',
-            'userPoints'
-        ]
-
-        for field in possible_fields:
-            if field in user_data and user_data[field] is not None:
-                points = self.safe_int(user_data[field])
-                if points > 0:
-                    return points
-
-        return 0
+        return to_int(value, default)
 
     def get_user_info(self, account: Dict, silent: bool = False) -> bool:
         """Mendapatkan user info dengan deteksi points yang lebih baik"""
@@ -233,29 +525,28 @@ class SomniaMultiAccountBot:
             response = session.get(url, timeout=30)
 
             if response.status_code == 200:
-                user_data = response.json()
-
-                account['raw_user_data'] = user_data
-                account['user_id'] = user_data.get('id')
-                account['referral_code'] = user_data.get('referralCode')
-                account['username'] = user_data.get('username')
-                account['is_bot'] = user_data.get('isBot')
-
-                socials = user_data.get('socials', {})
-                if isinstance(socials, dict):
-                    account['discord'] = socials.get('discord', {}).get('username')
-                    account['twitter'] = socials.get('twitter', {}).get('username')
-                    account['telegram'] = socials.get('telegram', {}).get('username')
-
-                points = self.extract_points_from_data(user_data)
+                user_data = USER_SCHEMA.decode(response.content)
+                if user_data is None:
+                    if not silent:
+                        print(f"❌ Get info gagal: respon bukan JSON object")
+                    return False
+
+                account['user_id'] = user_data['id']
+                account['referral_code'] = user_data['referralCode']
+                account['username'] = user_data['username']
+                account['is_bot'] = user_data['isBot']
+                account['discord'] = user_data['discord']
+                account['twitter'] = user_data['twitter']
+                account['telegram'] = user_data['telegram']
+
+                points = user_data['points']
                 account['points'] = points
-                account['streak'] = self.safe_int(user_data.get('streakCount', 0))
-
-                if 'lastGmAt' in user_data and user_data['lastGmAt']:
-                    account['last_claim'] = user_data['lastGmAt']
+                account['streak'] = self.safe_int(user_data['streakCount'])
 
-                if 'nextLogin' in user_data and user_data['nextLogin']:
-                    account['next_login'] = user_data['nextLogin']
+                # Data server menggantikan state tersimpan
+                account['last_claim'] = user_data['lastGmAt']
+                account['next_login'] = user_data['nextLogin']
+                account['refreshed_at'] = datetime.now(timezone.utc).isoformat()
 
                 if not silent:
                     print(f"   📊 Debug - Points found: {points}")
@@ -271,31 +562,22 @@ class SomniaMultiAccountBot:
                 print(f"❌ Error get info: {str(e)[:50]}")
             return False
 
-    def check_already_claimed_today(self, account: Dict) -> bool:
-        """Cek apakah sudah claim hari ini"""
+    def check_already_claimed_today(self, account: Dict, day_start: np.datetime64 = None) -> bool:
+        """Cek apakah sudah claim hari ini (day_start: awal hari WIB dalam UTC dari plan)"""
         if not account.get('last_claim'):
             return False
 
-        try:
-            last_claim_str = account['last_claim']
-            if isinstance(last_claim_str, str):
-                last_claim = datetime.fromisoformat(last_claim_str.replace('Z', '+00:00'))
-            else:
-                return False
-
-            wib = pytz.timezone('Asia/Jakarta')
-            now_wib = datetime.now(wib)
-            last_claim_wib = last_claim.astimezone(wib)
-
-            account['last_claim_date'] = last_claim_wib.strftime('%d/%m/%Y %H:%M WIB')
-
-            if last_claim_wib.date() == now_wib.date():
-                return True
+        # Recompute jika run sudah melewati tengah malam WIB sejak plan dibuat
+        if day_start is None or utc_now() >= day_start + ONE_DAY:
+            day_start = wib_day_start()
 
-            return False
-        except Exception as e:
+        last_claim = parse_utc_timestamps([account['last_claim']])[0]
+        if np.isnat(last_claim):
             return False
 
+        account['last_claim_date'] = format_wib_date(np.datetime_as_string(last_claim + WIB_OFFSET, unit='m'))
+        return bool(last_claim >= day_start)
+
     def claim_daily_gm(self, account: Dict, silent: bool = False) -> Dict:
         """Claim daily GM untuk satu akun"""
         session = self.create_session(account)
@@ -310,19 +592,17 @@ class SomniaMultiAccountBot:
             response = session.post(url, timeout=30)
 
             if response.status_code == 200:
-                result = response.json()
-
-                new_points = self.safe_int(result.get('finalPoints', 0))
+                result = GM_SCHEMA.decode(response.content)
+                if result is None:
+                    return {'success': False, 'message': 'Invalid response'}
 
-                if new_points == 0:
-                    new_points = self.extract_points_from_data(result)
-
-                streak = self.safe_int(result.get('streakCount', 0))
-                booster = self.safe_int(result.get('dailyBooster', 0))
+                new_points = result['points']
+                streak = self.safe_int(result['streakCount'])
+                booster = self.safe_int(result['dailyBooster'])
 
                 earned = new_points - old_points
 
-                account['last_claim'] = datetime.now().isoformat()
+                account['last_claim'] = datetime.now(timezone.utc).isoformat()
                 account['status'] = 'claimed'
                 account['points'] = new_points
                 account['streak'] = streak
@@ -381,8 +661,9 @@ class SomniaMultiAccountBot:
 
         print(f"{'='*70}\n")
 
-    def process_single_account(self, account: Dict, delay: int = 0, show_header: bool = True):
-        """Process satu akun"""
+    def process_single_account(self, account: Dict, delay: int = 0, show_header: bool = True, refresh: bool = True,
+                               day_start: np.datetime64 = None):
+        """Process satu akun (refresh=False: lewati get info, pakai data dari plan)"""
         if delay > 0:
             time.sleep(delay)
 
@@ -403,12 +684,14 @@ class SomniaMultiAccountBot:
 
         time.sleep(1)
 
-        print(f"│ ⏳ Getting info...{' '*50}│", end='\r')
-        if not self.get_user_info(account, silent=True):
-            print(f"│ ❌ Get info gagal{' '*51}│")
-            print(f"└{'─'*68}┘")
-            account['status'] = 'failed'
-            return
+        if refresh:
+            print(f"│ ⏳ Getting info...{' '*50}│", end='\r')
+            if not self.get_user_info(account, silent=True):
+                print(f"│ ❌ Get info gagal{' '*51}│")
+                print(f"└{'─'*68}┘")
+                account['status'] = 'failed'
+                return
+            self.save_claim_state()
 
         username = account.get('username') or '-'
         discord = account.get('discord') or '-'
@@ -420,11 +703,8 @@ class SomniaMultiAccountBot:
 
         time.sleep(1)
 
-        if self.check_already_claimed_today(account):
-            print(f"│ ✅ SUDAH CLAIM HARI INI{' '*45}│")
-            print(f"└{'─'*68}┘")
-            self.display_already_claimed_account(account)
-            account['status'] = 'already_claimed'
+        if refresh and self.check_already_claimed_today(account, day_start):
+            self.mark_already_claimed(account)
             return
 
         print(f"│ ⏳ Claiming...{' '*54}│", end='\r')
@@ -444,14 +724,62 @@ class SomniaMultiAccountBot:
             print(f"│ 🔥 Streak: {streak}{' '*58}│")
             account['status'] = 'claimed'
         else:
+            # State lokal bisa basi (mis. sudah claim dari web), cek ke server dulu
+            if not refresh and self.get_user_info(account, silent=True):
+                self.save_claim_state()
+                if self.check_already_claimed_today(account, day_start):
+                    self.mark_already_claimed(account)
+                    return
+
             error = self.shorten_text(result.get('message', 'Unknown'), 50)
             print(f"│ ❌ Claim gagal: {error:<50}    │")
             account['status'] = 'failed'
 
         print(f"└{'─'*68}┘")
 
-    def run_all_accounts(self, delay_between: int = 3):
-        """Run semua akun sequential"""
+    def mark_already_claimed(self, account: Dict):
+        """Tutup box akun dan tandai sudah claim hari ini"""
+        print(f"│ ✅ SUDAH CLAIM HARI INI{' '*45}│")
+        print(f"└{'─'*68}┘")
+        self.display_already_claimed_account(account)
+        account['status'] = 'already_claimed'
+
+    def build_claim_plan(self) -> Dict:
+        """Buat rencana claim seluruh akun dari lastGmAt/nextLogin yang sudah diketahui"""
+        return plan_claims(
+            [acc.get('last_claim') for acc in self.accounts],
+            [acc.get('next_login') for acc in self.accounts],
+            [acc.get('refreshed_at') for acc in self.accounts]
+        )
+
+    def print_claim_plan(self, plan: Dict):
+        """Tampilkan rencana claim dan perkiraan jumlah request"""
+        action_map = {
+            'claim': '🎯 Claim',
+            'skip': '⏭️  Skip',
+            'refresh': '🔄 Refresh'
+        }
+
+        print(f"📋 CLAIM PLAN")
+        print(f"{'-'*70}")
+        print(f"{'No':<4} {'Account':<10} {'Wallet':<14} {'Aksi':<12} {'Last Claim'}")
+        print(f"{'-'*70}")
+        for idx, (acc, action, last_claim) in enumerate(zip(self.accounts, plan['actions'], plan['last_claim_wib']), 1):
+            name = self.shorten_text(acc['name'], 8)
+            wallet = self.shorten_text(acc['wallet_address'], 12)
+            last_claim = format_wib_date(last_claim) or '-'
+            print(f"{idx:<4} {name:<10} {wallet:<14} {action_map[action]:<12} {last_claim}")
+        print(f"{'-'*70}")
+
+        counts = plan['counts']
+        if self.accounts and counts['refresh'] == len(self.accounts):
+            print(f"ℹ️  Belum ada state tersimpan — semua wallet perlu refresh")
+        print(f"🎯 Claim: {counts['claim']} │ ⏭️  Skip: {counts['skip']} │ 🔄 Refresh: {counts['refresh']}")
+        print(f"📡 Perkiraan request: {plan['expected_requests']}")
+        print(f"{'-'*70}\n")
+
+    def run_all_accounts(self, delay_between: int = 3, dry_run: bool = False):
+        """Run semua akun sequential berdasarkan claim plan"""
         wib = pytz.timezone('Asia/Jakarta')
         now_wib = datetime.now(wib)
 
@@ -462,13 +790,32 @@ class SomniaMultiAccountBot:
         print(f"🌐 Proxy: {'Yes' if self.use_proxy else 'No'} ({len(self.proxies)} available)")
         print(f"{'═'*70}\n")
 
-        for i, account in enumerate(self.accounts):
-            if i > 0:
+        plan = self.build_claim_plan()
+        self.print_claim_plan(plan)
+
+        if dry_run:
+            print("🧪 Dry run: tidak ada request yang dikirim")
+            return
+
+        sent = False
+        for account, action, last_claim in zip(self.accounts, plan['actions'], plan['last_claim_wib']):
+            if action == 'skip':
+                if utc_now() < plan['day_start'] + ONE_DAY:
+                    account['last_claim_date'] = format_wib_date(last_claim)
+                    account['status'] = 'already_claimed'
+                    continue
+                # Sudah lewat tengah malam WIB sejak plan dibuat, skip tidak berlaku lagi
+                action = 'refresh'
+
+            if sent:
                 time.sleep(delay_between)
+            sent = True
 
-            self.process_single_account(account, show_header=True)
+            self.process_single_account(account, show_header=True, refresh=(action == 'refresh'),
+                                        day_start=plan['day_start'])
 
         self.print_summary()
+        self.save_claim_state()
 
     def print_summary(self):
         """Tampilkan summary hasil"""
@@ -624,9 +971,10 @@ def main():
     print("2. Run dengan countdown (Auto 24 jam 1 menit)")
     print("3. Buat template pk.txt")
     print("4. Buat template proxy.txt")
+    print("5. Dry run (lihat claim plan tanpa request)")
     print("="*70)
 
-    choice = input("Pilih opsi (1/2/3/4): ").strip()
+    choice = input("Pilih opsi (1/2/3/4/5): ").strip()
 
     if choice == "3":
         create_pk_txt_template()
@@ -645,6 +993,10 @@ def main():
 
     print(f"✅ Loaded {count} accounts")
 
+    state_count = bot.load_claim_state("claim_state.json")
+    if state_count > 0:
+        print(f"✅ Loaded claim state untuk {state_count} accounts")
+
     print("\n📂 Loading proxies from proxy.txt...")
     proxy_count = bot.load_proxies_from_txt("proxy.txt")
     if proxy_count > 0:
@@ -660,6 +1012,9 @@ def main():
         bot.clear_private_keys()
     elif choice == "2":
         bot.run_with_countdown()
+    elif choice == "5":
+        bot.run_all_accounts(dry_run=True)
+        bot.clear_private_keys()
     else:
         print("❌ Pilihan tidak valid")
         return
@@ -672,9 +1027,11 @@ if __name__ == "__main__":
         from eth_account import Account
         from eth_account.messages import encode_defunct
         import pytz
+        import numpy
     except ImportError:
         print("❌ Library yang diperlukan belum terinstall")
-        print("📦 Install dengan: pip install web3 eth-account requests pytz")
+        print("📦 Install dengan: pip install web3 eth-account requests pytz numpy")
+        print("💡 Opsional (decode JSON lebih cepat): pip install msgspec orjson")
         exit(1)
 
     main()